@@ -4,7 +4,7 @@ import click # type: ignore
 import os
 import sys
 import glob
-from magi_cli.spells import commands_list, aliases, SANCTUM_PATH
+from magi_cli.spells import commands_list, aliases, load_command, SANCTUM_PATH
 from magi_cli.loci.spellcraft.spell_parse import SpellParser  # Import SpellParser
 
 @click.group()
@@ -49,7 +49,7 @@ def cast(input, verbose, **kwargs):
         for file in glob.glob(f"{tome_path}/*.spell"):
             click.echo(click.style(f"  🔮 {os.path.basename(file)}", fg="magenta"))
     elif input[0] in aliases:
-        command = aliases[input[0]]
+        command = load_command(aliases[input[0]])
         ctx = click.get_current_context()
         if len(input) > 1:
             ctx.invoke(command, args=input[1:])
@@ -60,7 +60,7 @@ def cast(input, verbose, **kwargs):
                 ctx.invoke(command)
     elif input[0] in cli.commands:
         ctx = click.get_current_context()
-        command = cli.commands[input[0]]
+        command = load_command(cli.commands[input[0]])
         if len(input) > 1:
             # Ensure the arguments are passed correctly
             ctx.invoke(command, args=input[1:])
@@ -1,19 +1,21 @@
 #!/usr/bin/env python3
 
+import io
 import os
 import random
 import math
-import svgwrite
 import hashlib
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 import json
-import yaml
-import tempfile
 import zipfile
 from enum import Enum
 
 from magi_cli.spells import SANCTUM_PATH
+from magi_cli.loci.spellcraft.spell_files import iter_spell_files
+
+# Read size used when streaming spell files into the sigil hash
+HASH_CHUNK_SIZE = 256 * 1024
 
 class SpellType(Enum):
     SCRIPT = 'script'
@@ -29,25 +31,25 @@ class Sigildry:
     and management for Magi spells.
     """
     
-    # Rune sets from SpellBundle
-    ELDER_FUTHARK = [
+    # Rune sets
+    ELDER_FUTHARK = (
         "ᚠ", "ᚢ", "ᚦ", "ᚨ", "ᚱ", "ᚲ", "ᚷ", "ᚹ", "ᚺ", "ᚾ", "ᛁ", "ᛃ", "ᛇ", "ᛈ", "ᛉ", "ᛊ",
         "ᛏ", "ᛒ", "ᛖ", "ᛗ", "ᛚ", "ᛜ", "ᛞ", "ᛟ"
-    ]
+    )
     
-    YOUNGER_FUTHARK = [
+    YOUNGER_FUTHARK = (
         "ᚠ", "ᚢ", "ᚦ", "ᚬ", "ᚱ", "ᚴ", "ᚼ", "ᚾ", "ᛁ", "ᛅ", "ᛋ", "ᛏ", "ᛒ", "ᛘ", "ᛚ", "ᛦ"
-    ]
+    )
     
-    MEDIEVAL_RUNES = [
+    MEDIEVAL_RUNES = (
         "ᛆ", "ᛒ", "ᛍ", "ᛑ", "ᛂ", "ᛓ", "ᛄ", "ᚻ", "ᛌ", "ᛕ", "ᛖ", "ᛗ", "ᚿ", "ᚮ", "ᛔ", "ᛩ",
         "ᛪ", "ᚱ", "ᛌ", "ᛐ", "ᚢ", "ᚡ", "ᚥ", "ᛨ"
-    ]
+    )
     
-    OGHAM = [
+    OGHAM = (
         "ᚁ", "ᚂ", "ᚃ", "ᚄ", "ᚅ", "ᚆ", "ᚇ", "ᚈ", "ᚉ", "ᚊ", "ᚋ", "ᚌ", "ᚍ", "ᚎ", "ᚏ", "ᚐ",
         "ᚑ", "ᚒ", "ᚓ", "ᚔ", "ᚕ"
-    ]
+    )
     
     ALL_RUNES = ELDER_FUTHARK + YOUNGER_FUTHARK + MEDIEVAL_RUNES + OGHAM
 
@@ -80,13 +82,24 @@ class Sigildry:
         return (x, y)
 
     def generate_sigil(self, hash_input: str, output_path: Path, size: int = 256) -> None:
-        """Generate a spell sigil SVG with enhanced starburst pattern."""
+        """Generate a spell sigil SVG and save it to output_path."""
+        self._draw_sigil(hash_input, size, output_path).save()
+
+    def render_sigil(self, hash_input: str, size: int = 256) -> bytes:
+        """Render a spell sigil SVG in memory and return its UTF-8 bytes."""
+        buffer = io.StringIO()
+        self._draw_sigil(hash_input, size).write(buffer)
+        return buffer.getvalue().encode('utf-8')
+
+    def _draw_sigil(self, hash_input: str, size: int, output_path: Optional[Path] = None):
+        """Draw a spell sigil with enhanced starburst pattern, returning the svgwrite Drawing."""
+        import svgwrite  # Only needed when a sigil is actually drawn
         center = size // 2
         ring_width = 10
         outer_radius = center - 20
         inner_radius = outer_radius - ring_width
         
-        dwg = svgwrite.Drawing(output_path, size=(size, size))
+        dwg = svgwrite.Drawing(output_path or 'sigil.svg', size=(size, size))
         dwg.add(dwg.rect(insert=(0, 0), size=(size, size), fill="white"))
         
         params = self._hash_to_params(hash_input)
@@ -117,7 +130,7 @@ class Sigildry:
         # Add center rune
         self._generate_center_rune(dwg, hash_input, center, size)
         
-        dwg.save()
+        return dwg
 
     def _generate_outer_rim(self, dwg, hash_input: str, center: int, radius: int, ring_width: int) -> None:
         """Generate outer rim with mixed runes."""
@@ -210,7 +223,9 @@ class Sigildry:
         version: str,
         entry_point: str,
         shell_type: Union[ShellType, str],
-        spell_dir: Path
+        spell_dir: Path,
+        file_contents: Optional[Dict[str, bytes]] = None,
+        archive: Optional[zipfile.ZipFile] = None
     ) -> str:
         """
         Generate a hash for a spell's sigil.
@@ -223,6 +238,10 @@ class Sigildry:
             entry_point (str): Entry point file path
             shell_type (Union[ShellType, str]): Shell type for the spell
             spell_dir (Path): Directory containing spell files
+            file_contents (Optional[Dict[str, bytes]]): Already-read spell files keyed by
+                path relative to spell_dir. When given, spell_dir is not walked again.
+            archive (Optional[zipfile.ZipFile]): Open spell bundle whose members are hashed
+                in place of spell_dir, streamed without extracting them.
             
         Returns:
             str: Generated hash for the sigil
@@ -240,24 +259,52 @@ class Sigildry:
         metadata_str = f"{spell_name}\n{description}\n{spell_type}\n{version}\n{entry_point}\n{shell_type}"
         hasher.update(metadata_str.encode())
 
-        # Add file contents to hash in a consistent order
-        for file_path in sorted(spell_dir.rglob('*')):
-            if file_path.is_file():
-                # Skip metadata and sigil files
-                if file_path.name in ['spell.json', 'spell.yaml'] or file_path.name.endswith('_sigil.svg'):
+        # Hash already-read contents in the same order as the directory walk below
+        if file_contents is not None:
+            for rel_path, content in sorted(file_contents.items(), key=lambda item: Path(item[0])):
+                name = Path(rel_path).name
+                if name in ['spell.json', 'spell.yaml'] or name.endswith('_sigil.svg'):
+                    continue
+                hasher.update(rel_path.encode())
+                hasher.update(content)
+            return hasher.hexdigest()
+
+        # Stream bundle members in the same order as the directory walk below
+        if archive is not None:
+            members = [info for info in archive.infolist() if not info.is_dir()]
+            for info in sorted(members, key=lambda info: Path(info.filename)):
+                rel_path = Path(info.filename)
+                if rel_path.name in ['spell.json', 'spell.yaml'] or rel_path.name.endswith('_sigil.svg'):
                     continue
-                    
-                # Get relative path for consistent hashing
-                rel_path = file_path.relative_to(spell_dir)
                 hasher.update(str(rel_path).encode())
+                with archive.open(info) as f:
+                    Sigildry._hash_stream(hasher, f)
+            return hasher.hexdigest()
+
+        # Add file contents to hash in a consistent order
+        for file_path, rel_path in sorted(iter_spell_files(spell_dir), key=lambda item: Path(item[1])):
+            # Skip metadata and sigil files
+            name = os.path.basename(rel_path)
+            if name in ['spell.json', 'spell.yaml'] or name.endswith('_sigil.svg'):
+                continue
                 
-                # Add file contents
-                with open(file_path, 'rb') as f:
-                    while chunk := f.read(8192):
-                        hasher.update(chunk)
+            # Get relative path for consistent hashing
+            hasher.update(rel_path.encode())
+            
+            # Add file contents
+            with open(file_path, 'rb') as f:
+                Sigildry._hash_stream(hasher, f)
 
         return hasher.hexdigest()
 
+    @staticmethod
+    def _hash_stream(hasher, f) -> None:
+        """Feed a binary file object into hasher through one reused HASH_CHUNK_SIZE buffer."""
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            hasher.update(view[:size])
+
     @staticmethod
     def generate_sigil_from_spell(
         spell_path: Path, 
@@ -324,21 +371,12 @@ class Sigildry:
             Dict[str, Any]: Verification details with 'verified' key
         """
         try:
-            # Unpack the spell bundle
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_dir_path = Path(temp_dir)
-                
-                # Extract spell contents
-                with zipfile.ZipFile(spell_path, 'r') as zip_ref:
-                    # Extract all files except spell.json and sigil
-                    for file_info in zip_ref.filelist:
-                        if file_info.filename not in ['spell.json', f"{Path(spell_path).stem}_sigil.svg"]:
-                            zip_ref.extract(file_info, temp_dir_path)
-                    
-                    # Load metadata from spell.json (primary source)
-                    metadata = {}
-                    with zip_ref.open('spell.json') as f:
-                        metadata = json.load(f)
+            # Hash the spell contents straight from the bundle
+            with zipfile.ZipFile(spell_path, 'r') as zip_ref:
+                # Load metadata from spell.json (primary source)
+                metadata = {}
+                with zip_ref.open('spell.json') as f:
+                    metadata = json.load(f)
                 
                 # If no metadata found at all
                 if not metadata:
@@ -369,14 +407,15 @@ class Sigildry:
                     version=metadata.get('version', '1.0.0'),
                     entry_point=metadata.get('entry_point', ''),
                     shell_type=metadata.get('shell_type', ''),
-                    spell_dir=temp_dir_path
+                    spell_dir=Path(spell_path).parent,
+                    archive=zip_ref
                 )
-                
+            
                 if verbose:
                     print(f"Verifying sigil hash:")
                     print(f"  Stored:  {stored_hash}")
                     print(f"  Current: {current_hash}")
-                
+            
                 if current_hash != stored_hash:
                     print(f"Sigil hash mismatch! Spell has been tampered with.\nStored: {stored_hash}\nCurrent: {current_hash}")
                     import sys
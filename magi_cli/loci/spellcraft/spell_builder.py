@@ -115,7 +115,7 @@ class SpellBuilder:
        self.create_spell_structure(spell_dir)
 
        bundle = SpellBundle(spell_dir)
-       return bundle.create_bundle(self.tome_dir)
+       return bundle.create_bundle(self.tome_dir, persist_yaml=False)
 
    def __del__(self):
        if self.temp_dir and self.temp_dir.exists():
@@ -3,18 +3,43 @@ import zipfile
 import tempfile
 import json
 import shutil
-import math
-import svgwrite
-from datetime import datetime
+import time
+import atexit
+import threading
+import uuid
 from pathlib import Path
-from io import BytesIO
 from typing import Optional, Dict, Any, Tuple, List, Union, Literal
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 import os
-import click
 from magi_cli.spells import SANCTUM_PATH
 from magi_cli.loci.spellcraft.sigildry import Sigildry
+from magi_cli.loci.spellcraft.spell_files import iter_spell_files, extract_members
+
+# Use libyaml's C loader when PyYAML was built with it
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+try:
+    import orjson  # Optional: faster spell.json serialization
+except ImportError:
+    orjson = None
+
+# DEFLATE level for spell bundles. Spells are mostly source text, so a lower
+# level bundles noticeably faster for only a slightly larger archive.
+# Out-of-range values are clamped to 0-9; anything non-numeric falls back to 3.
+try:
+    SPELL_COMPRESS_LEVEL = min(9, max(0, int(os.getenv('MAGI_SPELL_COMPRESS_LEVEL', '3'))))
+except ValueError:
+    SPELL_COMPRESS_LEVEL = 3
+
+try:
+    from isal import isal_zlib as zlib  # Optional: SIMD-accelerated DEFLATE and CRC32
+except ImportError:
+    import zlib
+
+# ISA-L only accepts levels 0-3, so clamp the level for the direct deflate path
+DEFLATE_LEVEL = min(SPELL_COMPRESS_LEVEL, getattr(zlib, 'ISAL_BEST_COMPRESSION', zlib.Z_BEST_COMPRESSION))
 
 class SpellType(str, Enum):
     BUNDLED = "bundled"
@@ -28,26 +53,9 @@ class ShellType(str, Enum):
 class SpellBundle:
     """Manages the creation and packaging of spell bundles."""
 
-    ELDER_FUTHARK = [
-        "ᚠ", "ᚢ", "ᚦ", "ᚨ", "ᚱ", "ᚲ", "ᚷ", "ᚹ", "ᚺ", "ᚾ", "ᛁ", "ᛃ", "ᛇ", "ᛈ", "ᛉ", "ᛊ",
-        "ᛏ", "ᛒ", "ᛖ", "ᛗ", "ᛚ", "ᛜ", "ᛞ", "ᛟ"
-    ]
-    
-    YOUNGER_FUTHARK = [
-        "ᚠ", "ᚢ", "ᚦ", "ᚬ", "ᚱ", "ᚴ", "ᚼ", "ᚾ", "ᛁ", "ᛅ", "ᛋ", "ᛏ", "ᛒ", "ᛘ", "ᛚ", "ᛦ"
-    ]
-    
-    MEDIEVAL_RUNES = [
-        "ᛆ", "ᛒ", "ᛍ", "ᛑ", "ᛂ", "ᛓ", "ᛄ", "ᚻ", "ᛌ", "ᛕ", "ᛖ", "ᛗ", "ᚿ", "ᚮ", "ᛔ", "ᛩ",
-        "ᛪ", "ᚱ", "ᛌ", "ᛐ", "ᚢ", "ᚡ", "ᚥ", "ᛨ"
-    ]
-    
-    OGHAM = [
-        "ᚁ", "ᚂ", "ᚃ", "ᚄ", "ᚅ", "ᚆ", "ᚇ", "ᚈ", "ᚉ", "ᚊ", "ᚋ", "ᚌ", "ᚍ", "ᚎ", "ᚏ", "ᚐ",
-        "ᚑ", "ᚒ", "ᚓ", "ᚔ", "ᚕ"
-    ]
-    
-    ALL_RUNES = ELDER_FUTHARK + YOUNGER_FUTHARK + MEDIEVAL_RUNES + OGHAM
+    # Per-process root that every extract_bundle() call unpacks beneath
+    _extract_root: Optional[Path] = None
+    _extract_lock = threading.Lock()
 
     # TODO: See if this can just be passed from spellcraft
     def __init__(self, path: Path):
@@ -59,6 +67,19 @@ class SpellBundle:
         self.tome_dir = Path(SANCTUM_PATH) / '.tome'
         self.tome_dir.mkdir(parents=True, exist_ok=True)
 
+    def _compute_sigil_hash(self, config: Dict[str, Any], file_contents: Optional[Dict[str, bytes]] = None) -> str:
+        """Compute the sigil hash for the spell directory, optionally from already-read file contents."""
+        return Sigildry.generate_sigil_hash(
+            spell_name=config['name'],
+            description=config.get('description', ''),
+            spell_type=config.get('type', 'generic'),
+            version=config.get('version', '1.0.0'),
+            entry_point=config.get('entry_point', ''),
+            shell_type=config.get('shell_type', ''),
+            spell_dir=self.spell_dir,
+            file_contents=file_contents
+        )
+
     def _generate_spell_sigil(self, config: Dict[str, Any], sigil_hash: Optional[str] = None) -> Tuple[str, Path]:
         """
         Generate a sigil for a spell bundle.
@@ -72,26 +93,106 @@ class SpellBundle:
         """
         # Use provided hash or generate a new one
         if not sigil_hash:
-            sigil_hash = Sigildry.generate_sigil_hash(
-                spell_name=config['name'],
-                description=config.get('description', ''),
-                spell_type=config.get('type', 'generic'),
-                version=config.get('version', '1.0.0'),
-                entry_point=config.get('entry_point', ''),
-                shell_type=config.get('shell_type', ''),
-                spell_dir=self.spell_dir
-            )
+            sigil_hash = self._compute_sigil_hash(config)
         
         # Generate sigil path
         sigil_path = self.spell_dir / f"{config['name']}_sigil.svg"
         
         # Generate sigil
+        import click
         click.echo(click.style("» Manifesting sigil at:", fg="bright_blue") + 
                   click.style(f" {sigil_path}", fg="cyan"))
         Sigildry.generate_sigil_from_spell(self.spell_dir, sigil_hash, sigil_path)
         
         return sigil_hash, sigil_path
 
+    @staticmethod
+    def _created_at() -> str:
+        """UTC creation timestamp for spell.json metadata."""
+        return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+    @staticmethod
+    def _dump_metadata(metadata: Dict[str, Any]) -> bytes:
+        """Serialize spell.json metadata, using orjson when it is installed."""
+        if orjson is not None:
+            return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+        return json.dumps(metadata, indent=2).encode('utf-8')
+
+    @staticmethod
+    def _deflate_file(file_path: str, arcname: str) -> Tuple[zipfile.ZipInfo, bytes, bytes]:
+        """Read a file and raw-deflate it, returning its zip entry header, raw bytes and compressed bytes."""
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname, strict_timestamps=False)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        return zinfo, data, SpellBundle._deflate(zinfo, data)
+
+    @staticmethod
+    def _deflate(zinfo: zipfile.ZipInfo, data: bytes) -> bytes:
+        """Raw-deflate data with zlib and fill in the entry's size, CRC and compression fields."""
+        compressor = zlib.compressobj(DEFLATE_LEVEL, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(compressed)
+        zinfo.CRC = zlib.crc32(data)
+        return compressed
+
+    @staticmethod
+    def _writestr_deflated(zf: zipfile.ZipFile, arcname: str, data: Union[str, bytes]) -> None:
+        """Add in-memory data to a bundle, deflating it directly instead of through ZipFile.writestr."""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        zinfo = zipfile.ZipInfo(arcname, time.localtime(time.time())[:6])
+        zinfo.external_attr = 0o600 << 16  # Same permissions writestr would use
+        SpellBundle._append_deflated(zf, zinfo, SpellBundle._deflate(zinfo, data))
+
+    @staticmethod
+    def _append_deflated(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, compressed: bytes) -> None:
+        """Append an already-deflated entry to a bundle opened for writing."""
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zf.fp.write(zinfo.FileHeader())
+        zf.fp.write(compressed)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+
+    @staticmethod
+    def _write_files(zf: zipfile.ZipFile, files: List[Tuple[str, str]], report: bool = False) -> Dict[str, bytes]:
+        """
+        Add files to a bundle, deflating them in parallel.
+
+        zlib releases the GIL while compressing, so each file is deflated on a
+        worker thread and the results are appended to the zip in order.
+
+        Args:
+            zf (zipfile.ZipFile): Bundle opened for writing
+            files (List[Tuple[str, str]]): (file path, archive name) pairs
+            report (bool): Print each added file and warn instead of raising on failure
+
+        Returns:
+            Dict[str, bytes]: Raw contents of the added files keyed by archive name,
+                              so callers can hash them without reading the files again
+        """
+        contents = {}
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [(file_path, arcname, executor.submit(SpellBundle._deflate_file, file_path, arcname))
+                       for file_path, arcname in files]
+            for file_path, arcname, future in futures:
+                try:
+                    zinfo, data, compressed = future.result()
+                    if report:
+                        print(f"  Adding: {arcname}")
+                    SpellBundle._append_deflated(zf, zinfo, compressed)
+                    contents[arcname] = data
+                except Exception as e:
+                    if not report:
+                        raise
+                    print(f"Warning: Could not add file {file_path}: {e}")
+        return contents
+
     def create(self, output_dir: Optional[Path] = None) -> Path:
         """
         Create a spell bundle from the spell directory.
@@ -106,8 +207,18 @@ class SpellBundle:
         destination_dir = output_dir or self.tome_dir
         return self.create_bundle(destination_dir)
 
-    def create_bundle(self, destination_dir: Path) -> Path:
-        """Create a spell bundle from a directory with sigil."""
+    def create_bundle(self, destination_dir: Path, persist_yaml: bool = True) -> Path:
+        """
+        Create a spell bundle from a directory with sigil.
+        
+        Args:
+            destination_dir (Path): Directory to save the spell bundle in
+            persist_yaml (bool): Also write the hash-stamped spell.yaml back to the
+                                 spell directory. Pass False for throwaway directories.
+        
+        Returns:
+            Path: Path to the created spell bundle
+        """
         if not self.is_valid_spell_dir:
             raise ValueError(f"Invalid spell directory: {self.spell_dir}")
             
@@ -115,74 +226,127 @@ class SpellBundle:
         config = self.load_config()
         self.verify_assets()
         
-        # Generate sigil
-        sigil_hash, sigil_path = self._generate_spell_sigil(config)
-        
-        # Update spell.yaml with the hash
-        config['sigil_hash'] = sigil_hash
-        yaml_path = self.spell_dir / 'spell' / 'spell.yaml'
-        with open(yaml_path, 'w') as f:
-            yaml.safe_dump(config, f, default_flow_style=False)
-        
         # Create bundle path
         bundle_name = f"{config['name']}.spell"
         bundle_path = destination_dir / bundle_name
         
+        # spell.yaml and the sigil are rewritten below, so they are added after hashing
+        yaml_path = self.spell_dir / 'spell' / 'spell.yaml'
+        sigil_path = self.spell_dir / f"{config['name']}_sigil.svg"
+        skipped = {os.path.join('spell', 'spell.yaml'), sigil_path.name}
+        files = [(file_path, rel_path) for file_path, rel_path in iter_spell_files(self.spell_dir)
+                 if rel_path not in skipped]
+        
+        # Reuse the existing bundle if nothing in the spell directory has changed
+        fingerprint = self._source_fingerprint(config, files)
+        if self._read_fingerprint(bundle_path) == fingerprint:
+            import click
+            click.echo(click.style("» Spell unchanged, reusing bundle:", fg="bright_blue") + 
+                      click.style(f" {bundle_path}", fg="cyan"))
+            return bundle_path
+        
         # Create the zip bundle
-        with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=SPELL_COMPRESS_LEVEL) as zf:
+            # Add all files preserving directory structure, hashing them as they are read
+            contents = self._write_files(zf, files)
+            
+            # Generate sigil
+            sigil_hash, sigil_path = self._generate_spell_sigil(config, self._compute_sigil_hash(config, contents))
+            zf.write(sigil_path, sigil_path.name)
+            
+            # Add spell.yaml updated with the hash straight from memory
+            config['sigil_hash'] = sigil_hash
+            yaml_text = yaml.safe_dump(config, default_flow_style=False)
+            self._writestr_deflated(zf, os.path.join('spell', 'spell.yaml'), yaml_text)
+            if persist_yaml:
+                yaml_path.write_text(yaml_text)
+            
             # Create metadata
             metadata = {
                 "name": config["name"],
                 "description": config["description"],
-                "created_at": datetime.now().isoformat(),
+                "created_at": self._created_at(),
                 "entry_point": config["entry_point"],
                 "shell_type": config.get("shell_type", "python"),
                 "type": config.get("type", "bundled"),
                 "version": config.get("version", "1.0.0"),
                 "sigil_hash": sigil_hash,
-                "dependencies": config.get('dependencies', {'python': []})
+                "dependencies": config.get('dependencies', {'python': []}),
+                "source_fingerprint": fingerprint
             }
             
             # Add metadata
-            zf.writestr('spell.json', json.dumps(metadata, indent=2))
-            
-            # Add all files preserving directory structure
-            for file_path in self.spell_dir.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(self.spell_dir)
-                    zf.write(file_path, arcname)
+            self._writestr_deflated(zf, 'spell.json', self._dump_metadata(metadata))
         
         return bundle_path
 
+    def _source_fingerprint(self, config: Dict[str, Any], files: List[Tuple[str, str]]) -> str:
+        """
+        Fingerprint the spell sources from file names and contents plus the loaded config.
+
+        Neither the spell directory's location nor file mtimes are included, since
+        spellcraft rebuilds spells from fresh temporary copies every time.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        source_config = {key: value for key, value in config.items() if key != 'sigil_hash'}
+        digest.update(json.dumps(source_config, sort_keys=True, default=str).encode())
+        for file_path, rel_path in sorted(files, key=lambda item: item[1]):
+            with open(file_path, 'rb') as f:
+                file_digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+            digest.update(f"{rel_path}\0{file_digest}\n".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_fingerprint(bundle_path: Path) -> Optional[str]:
+        """Return the source fingerprint recorded in an existing bundle, if any."""
+        try:
+            with zipfile.ZipFile(bundle_path) as zf:
+                return json.loads(zf.read('spell.json')).get('source_fingerprint')
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+
     def extract_bundle(self, extract_dir: Optional[Path] = None) -> Tuple[Path, Dict[str, Any]]:
         """Extract a bundled spell and return the temp directory and metadata."""
         if not self.spell_dir.suffix == '.spell' or not zipfile.is_zipfile(self.spell_dir):
             raise ValueError(f"Not a valid spell bundle: {self.spell_dir}")
             
         if extract_dir is None:
-            temp_dir = Path(tempfile.mkdtemp(prefix='magi_spell_'))
-            extract_dir = temp_dir
+            extract_dir = self._new_extract_dir()
+            self.temp_dir = extract_dir
             
         with zipfile.ZipFile(self.spell_dir) as zf:
-            zf.extractall(extract_dir)
-            with open(extract_dir / 'spell.json') as f:
-                metadata = json.load(f)
+            extract_members(zf, extract_dir)
+            metadata = json.loads(zf.read('spell.json'))
             
         return extract_dir, metadata
 
+    @classmethod
+    def _new_extract_dir(cls) -> Path:
+        """Create a fresh extraction directory under the per-process extraction root."""
+        with cls._extract_lock:
+            if cls._extract_root is None:
+                cls._extract_root = Path(tempfile.mkdtemp(prefix='magi_spell_root_'))
+                atexit.register(shutil.rmtree, cls._extract_root, ignore_errors=True)
+        extract_dir = cls._extract_root / uuid.uuid4().hex
+        extract_dir.mkdir()
+        return extract_dir
+
     def cleanup(self):
         """Clean up temporary files."""
         if hasattr(self, 'temp_dir') and self.temp_dir and self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
 
     def load_config(self) -> Dict[str, Any]:
-        """Load and validate the spell configuration."""
+        """Load and validate the spell configuration, parsing spell.yaml only once."""
+        if self.config is not None:
+            return self.config
+        
         config_path = self.spell_dir / 'spell' / 'spell.yaml'
         if not config_path.exists():
             raise ValueError(f"No spell.yaml found in {self.spell_dir}")
             
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlLoader)
             
         # Basic validation
         required_fields = ['name', 'version', 'description', 'type', 'entry_point']
@@ -190,6 +354,7 @@ class SpellBundle:
         if missing:
             raise ValueError(f"Missing required fields in spell.yaml: {', '.join(missing)}")
             
+        self.config = config
         return config
     
     def verify_assets(self) -> bool:
@@ -201,9 +366,9 @@ class SpellBundle:
                 raise ValueError(f"Required asset missing: {asset['path']}")
         return True
     
-    def create(self, spell_name: str, nested_dir: Path, sigil_hash: Optional[str] = None) -> Path:
+    def create_from_nested(self, spell_name: str, nested_dir: Path, sigil_hash: Optional[str] = None) -> Path:
         """
-        Create a spell bundle from a directory.
+        Create a spell bundle from a nested spell directory (one holding spell.yaml directly).
         
         Args:
             spell_name (str): Name of the spell
@@ -224,41 +389,29 @@ class SpellBundle:
         # Ensure config has required fields
         config.setdefault('name', spell_name)
         
-        # Generate sigil
-        sigil_hash, sigil_path = self._generate_spell_sigil(config, sigil_hash)
+        # Compute sigil hash; the sigil itself is rendered once, into the bundle
+        if not sigil_hash:
+            sigil_hash = self._compute_sigil_hash(config)
         
         # Create bundle
         bundle_path = self.tome_dir / f"{spell_name}.spell"
         
-        with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=SPELL_COMPRESS_LEVEL) as zf:
             # Add all files from spell directory first
             print("- Adding files to bundle:")
-            for file_path in nested_dir.rglob('*'):
-                if file_path.is_file():
-                    try:
-                        arcname = file_path.relative_to(nested_dir)
-                        print(f"  Adding: {arcname}")
-                        # Read file content and add to zip to avoid file locking
-                        content = file_path.read_bytes()
-                        zf.writestr(str(arcname), content)
-                    except Exception as e:
-                        print(f"Warning: Could not add file {file_path}: {e}")
-            
-            # Generate sigil ONCE and add to bundle
-            sigil_path = nested_dir / f"{spell_name}_sigil.svg"
-            print(f"- Generating sigil at: {sigil_path}")
-            Sigildry.generate_sigil_from_spell(nested_dir, sigil_hash, sigil_path)
+            files = list(iter_spell_files(nested_dir))
+            self._write_files(zf, files, report=True)
             
-            # Add sigil to bundle
+            # Render sigil in memory and add to bundle
             sigil_name = f"{spell_name}_sigil.svg"
-            with open(sigil_path, 'rb') as sigil_file:
-                zf.writestr(sigil_name, sigil_file.read())
+            print(f"- Generating sigil: {sigil_name}")
+            self._writestr_deflated(zf, sigil_name, Sigildry().render_sigil(sigil_hash))
             
             # Store the hash in metadata and add metadata last
             metadata = {
                 "name": config['name'],
                 "description": config.get('description', ''),
-                "created_at": datetime.now().isoformat(),
+                "created_at": self._created_at(),
                 "entry_point": config.get('entry_point', ''),
                 "shell_type": config.get('shell_type', 'python'),
                 "type": config.get('type', 'generic'),
@@ -266,7 +419,7 @@ class SpellBundle:
                 "sigil_hash": sigil_hash,
                 "dependencies": config.get('dependencies', {'python': []})
             }
-            zf.writestr('spell.json', json.dumps(metadata, indent=2))
+            self._writestr_deflated(zf, 'spell.json', self._dump_metadata(metadata))
         
         return bundle_path
 
@@ -278,7 +431,8 @@ class SpellBundle:
                           entry_point: str, 
                           description: str, 
                           spell_dir: Path,
-                          verify_structure: bool = True) -> Path:
+                          verify_structure: bool = True,
+                          persist_yaml: bool = True) -> Path:
         # Normalize types
         if isinstance(spell_type, str):
             spell_type = getattr(SpellType, spell_type.upper(), SpellType.SCRIPT)
@@ -289,7 +443,7 @@ class SpellBundle:
         metadata = {
             "name": spell_name,
             "description": description,
-            "created_at": datetime.now().isoformat(),
+            "created_at": cls._created_at(),
             "entry_point": entry_point,
             "shell_type": shell_type,
             "type": spell_type,
@@ -302,23 +456,15 @@ class SpellBundle:
 
         try:
             # Create zip bundle
-            with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=SPELL_COMPRESS_LEVEL) as zf:
                 # Add all files from spell directory first
                 print("- Adding files to bundle:")
-                for file_path in spell_dir.rglob('*'):
-                    if file_path.is_file():
-                        try:
-                            arcname = file_path.relative_to(spell_dir)
-                            print(f"  Adding: {arcname}")
-                            # Read file content and add to zip to avoid file locking
-                            content = file_path.read_bytes()
-                            zf.writestr(str(arcname), content)
-                        except Exception as e:
-                            print(f"Warning: Could not add file {file_path}: {e}")
+                files = list(iter_spell_files(spell_dir))
+                contents = cls._write_files(zf, files, report=True)
                 
-                # Generate sigil ONCE and add to bundle
-                sigil_path = spell_dir / f"{spell_name}_sigil.svg"
-                print(f"- Generating sigil at: {sigil_path}")
+                # Render sigil in memory and add to bundle
+                sigil_name = f"{spell_name}_sigil.svg"
+                print(f"- Generating sigil: {sigil_name}")
                 sigil_hash = Sigildry.generate_sigil_hash(
                     spell_name=spell_name,
                     description=description,
@@ -326,22 +472,18 @@ class SpellBundle:
                     version="1.0.0",
                     entry_point=entry_point,
                     shell_type=shell_type,
-                    spell_dir=spell_dir
+                    spell_dir=spell_dir,
+                    file_contents=contents
                 )
-                Sigildry.generate_sigil_from_spell(spell_dir, sigil_hash, sigil_path)
-                
-                # Add sigil to bundle
-                sigil_name = f"{spell_name}_sigil.svg"
-                with open(sigil_path, 'rb') as sigil_file:
-                    zf.writestr(sigil_name, sigil_file.read())
+                cls._writestr_deflated(zf, sigil_name, Sigildry().render_sigil(sigil_hash))
                 
                 # Store the hash in metadata and add metadata last
                 metadata['sigil_hash'] = sigil_hash
-                zf.writestr('spell.json', json.dumps(metadata, indent=2))
+                cls._writestr_deflated(zf, 'spell.json', cls._dump_metadata(metadata))
 
                 # Update spell.yaml with the hash
                 yaml_path = spell_dir / 'spell' / 'spell.yaml'
-                if yaml_path.exists():
+                if persist_yaml and yaml_path.exists():
                     with open(yaml_path) as f:
                         yaml_config = yaml.safe_load(f)
                     yaml_config['sigil_hash'] = sigil_hash
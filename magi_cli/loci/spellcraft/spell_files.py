@@ -0,0 +1,77 @@
+import os
+import struct
+import zipfile
+from pathlib import Path
+from typing import Iterator, Tuple, List, Union, Container
+
+try:
+    from isal import isal_zlib as zlib  # Optional: SIMD-accelerated inflate and CRC32
+except ImportError:
+    import zlib
+
+def iter_spell_files(root: Union[Path, str]) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (full path, relative path) string pairs for every file below root.
+
+    Walks with os.scandir so each entry's type comes from the directory listing.
+    Symlinked directories are not descended into, as Path.rglob does not.
+    """
+    stack = [(os.fspath(root), '')]
+    while stack:
+        directory, rel_dir = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path))
+                elif entry.is_file():
+                    yield entry.path, rel_path
+
+def read_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    """
+    Read one bundle member, inflating DEFLATE entries in a single zlib call.
+
+    With python-isal installed this inflates with ISA-L instead of stdlib zlib.
+    Other compression methods and encrypted entries go through zipfile as usual.
+    """
+    if info.compress_type != zipfile.ZIP_DEFLATED or info.flag_bits & 0x1:
+        return zip_ref.read(info)
+
+    # Skip the local file header to reach the raw deflate stream
+    zip_ref.fp.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, zip_ref.fp.read(zipfile.sizeFileHeader))
+    zip_ref.fp.seek(header[10] + header[11], os.SEEK_CUR)
+    data = zlib.decompress(zip_ref.fp.read(info.compress_size), -15)
+
+    if len(data) != info.file_size or zlib.crc32(data) != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+    return data
+
+def extract_members(zip_ref: zipfile.ZipFile, extract_dir: Union[Path, str], skip: Container[str] = ()) -> List[str]:
+    """
+    Extract a bundle's members into extract_dir and return the extracted file names.
+
+    Every member path is checked to stay inside extract_dir before anything is
+    written, and each directory is created only once. Members named in skip are left out.
+    """
+    root = os.path.realpath(extract_dir)
+    targets = []
+    for info in zip_ref.infolist():
+        if info.filename in skip:
+            continue
+        target = os.path.realpath(os.path.join(root, info.filename))
+        if os.path.commonpath([root, target]) != root:
+            raise ValueError(f"Unsafe path in spell bundle: {info.filename}")
+        targets.append((info, target))
+
+    directories = {target if info.is_dir() else os.path.dirname(target) for info, target in targets}
+    for directory in sorted(directories):
+        os.makedirs(directory, exist_ok=True)
+
+    extracted = []
+    for info, target in targets:
+        if not info.is_dir():
+            with open(target, 'wb') as f:
+                f.write(read_member(zip_ref, info))
+            extracted.append(info.filename)
+    return extracted
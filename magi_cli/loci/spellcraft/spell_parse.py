@@ -3,78 +3,242 @@ import os
 import json
 import zipfile
 import tempfile
+import contextlib
 import hashlib
 import subprocess
 import sys
 import click  # Ensure click is imported
 import shutil
+import yaml
 from pathlib import Path
-from typing import Tuple, Dict, Any, Optional, List
+from typing import Tuple, Dict, Any, Optional, List, Callable
 from magi_cli.spells import SANCTUM_PATH
 from magi_cli.loci.spellcraft.sigildry import Sigildry
+from magi_cli.loci.spellcraft.spell_files import extract_members, iter_spell_files
+
+# Use libyaml's C loader when PyYAML was built with it
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+try:
+    from orjson import loads as json_loads  # Optional: faster spell.json parsing
+except ImportError:
+    from json import loads as json_loads
+
+# Error message templates, styled once at import instead of on every message
+ERROR_TEMPLATE = click.style("{label}", fg="bright_red") + click.style("{detail}", fg="red")
+INVALID_TEMPLATE = click.style("{label}", fg="bright_red") + click.style("{detail}", fg="red", bold=True)
+
+# Extracted bundles, reused across runs and keyed by sigil hash
+BUNDLE_CACHE_DIR = Path(SANCTUM_PATH) / '.cache'
 
 class SpellParser:
     """Parser for spell bundles with enhanced validation."""
     
     # Required metadata fields
-    REQUIRED_FIELDS = ['name', 'version', 'description', 'type', 'entry_point']
-    ALLOWED_TYPES = ['bundled', 'macro', 'script']  # Updated to include 'script'
-    ALLOWED_SHELLS = ['python', 'bash', 'shell']
-    ALLOWED_EXTENSIONS = ['.py', '.sh', '.spell', '.fiat']  # Added extensions list
+    REQUIRED_FIELDS = frozenset({'name', 'version', 'description', 'type', 'entry_point'})
+    ALLOWED_TYPES = frozenset({'bundled', 'macro', 'script'})  # Updated to include 'script'
+    ALLOWED_SHELLS = frozenset({'python', 'bash', 'shell'})
+    ALLOWED_EXTENSIONS = frozenset({'.py', '.sh', '.spell', '.fiat'})  # Added extensions list
+    # Entry point locations within a bundle, in order of preference
+    ENTRY_POINT_PREFIXES = ('spell/', '', 'spell/spell/')  # spell/, root, legacy spell/spell/
     
     @staticmethod
-    def parse_bundle(spell_path: str) -> Tuple[Path, Dict]:
+    def parse_bundle(
+        spell_path: str,
+        extract_dir: Optional[Path] = None,
+        *,
+        sigil_verification: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Path, Dict]:
         """
         Parse a spell bundle into a temporary directory and return the path and metadata.
+        
+        Args:
+            spell_path (str): Path to the spell bundle
+            extract_dir (Optional[Path]): Existing directory to extract into.
+                                          A new temporary directory is created if omitted.
+            sigil_verification (Optional[Dict[str, Any]]): Result of an earlier
+                                          Sigildry.verify_sigil call for this bundle.
+                                          The bundle is verified here if omitted.
         """
-        import tempfile
-        import zipfile
-        import yaml  # Make sure yaml is imported
-        import json  # Import json for spell.json
-        import os
-
-        # Create a temporary directory
-        temp_dir = Path(tempfile.mkdtemp(prefix='magi_spell_'))
-
-        # Extract the spell bundle
         with zipfile.ZipFile(spell_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
+            names = set(zip_ref.namelist())
 
-        # Initialize metadata
-        metadata = {}
+            # Load spell.yaml or spell.json straight from the archive
+            if 'spell/spell.yaml' in names:
+                config = yaml.load(zip_ref.read('spell/spell.yaml'), Loader=YamlLoader)
+            elif 'spell/spell.json' in names:
+                config = json_loads(zip_ref.read('spell/spell.json'))
+            else:
+                raise FileNotFoundError("No metadata file (spell.yaml or spell.json) found in the spell.")
+            metadata = SpellParser._convert_yaml_to_metadata(config)
 
-        # Load spell.yaml or spell.json
-        yaml_path = temp_dir / 'spell' / 'spell.yaml'
-        json_path = temp_dir / 'spell' / 'spell.json'
+            # Verify spell sigil using Sigildry unless the caller already has
+            if sigil_verification is None:
+                sigil_verification = Sigildry.verify_sigil(spell_path)
+            
+            # Add sigil verification details to metadata
+            metadata['sigil_verification'] = {
+                'status': sigil_verification.get('verification_status', 'Unknown'),
+                'details': sigil_verification.get('details', 'No details'),
+                'verified': sigil_verification.get('verified', False),
+                'current_hash': sigil_verification.get('current_hash'),
+                'stored_hash': sigil_verification.get('stored_hash')
+            }
 
-        if yaml_path.exists():
-            with open(yaml_path, 'r') as f:
-                config = yaml.safe_load(f)
-                metadata = SpellParser._convert_yaml_to_metadata(config)
-        elif json_path.exists():
-            with open(json_path, 'r') as f:
-                config = json.load(f)
-                metadata = SpellParser._convert_yaml_to_metadata(config)
-        else:
-            raise FileNotFoundError("No metadata file (spell.yaml or spell.json) found in the spell.")
+            # Validate metadata
+            SpellParser._validate_metadata(metadata)
 
-        # Verify spell sigil using Sigildry
-        sigil_verification = Sigildry.verify_sigil(spell_path)
-        
-        # Add sigil verification details to metadata
-        metadata['sigil_verification'] = {
-            'status': sigil_verification.get('verification_status', 'Unknown'),
-            'details': sigil_verification.get('details', 'No details'),
-            'verified': sigil_verification.get('verified', False),
-            'current_hash': sigil_verification.get('current_hash'),
-            'stored_hash': sigil_verification.get('stored_hash')
-        }
+            # Extract everything the spell may use at runtime; the bundle's own
+            # spell.json and sigil are only needed for verification above
+            bookkeeping = {'spell.json', f"{metadata['name']}_sigil.svg"}
+            temp_dir = Path(extract_dir) if extract_dir else Path(tempfile.mkdtemp(prefix='magi_spell_'))
+            extracted = extract_members(zip_ref, temp_dir, skip=bookkeeping)
+
+            # Record the extracted names so callers can list them without walking the disk
+            metadata['_bundle_files'] = extracted
 
-        # Validate metadata
-        SpellParser._validate_metadata(metadata)
+            # Resolve the entry point from the archive listing rather than probing the disk
+            extracted_names = set(extracted)
+            metadata['_resolved_entry'] = next(
+                (prefix + metadata['entry_point'] for prefix in SpellParser.ENTRY_POINT_PREFIXES
+                 if prefix + metadata['entry_point'] in extracted_names),
+                None
+            )
 
         # Return the temporary directory and metadata
         return temp_dir, metadata
+
+    @staticmethod
+    def parse_bundle_cached(
+        spell_path: Path,
+        sigil_verification: Dict[str, Any],
+        make_scratch_dir: Optional[Callable[[], Path]] = None
+    ) -> Tuple[Path, Dict]:
+        """
+        Parse a spell bundle, reusing an earlier extraction with the same sigil hash.
+        
+        Extractions live read-only in BUNDLE_CACHE_DIR/<sigil_hash>, with their metadata
+        in a <sigil_hash>.json sidecar that also records the bundle's path, size and mtime,
+        so a rebuilt bundle is extracted afresh and its old entry pruned. A cached tree is
+        rehashed before reuse and extracted again if it no longer matches its sigil.
+        sigil_verification is the result of Sigildry.verify_sigil for the bundle; without
+        a current hash in it this is plain parse_bundle. Extractions that cannot be
+        cached go to the directory returned by make_scratch_dir, which is only called
+        when one is needed.
+        """
+        sigil_hash = sigil_verification.get('current_hash')
+        if not sigil_hash:
+            return SpellParser.parse_bundle(spell_path,
+                                            extract_dir=make_scratch_dir() if make_scratch_dir else None,
+                                            sigil_verification=sigil_verification)
+
+        stat = os.stat(spell_path)
+        bundle_stamp = [stat.st_size, stat.st_mtime_ns]
+        cache_dir = BUNDLE_CACHE_DIR / sigil_hash
+        sidecar_path = BUNDLE_CACHE_DIR / f"{sigil_hash}.json"
+
+        if sidecar_path.exists() and cache_dir.is_dir():
+            cached = json_loads(sidecar_path.read_bytes())
+            if (cached.get('bundle_stamp') == bundle_stamp and
+                    SpellParser._cache_entry_intact(cache_dir, sigil_hash, sigil_verification)):
+                return cache_dir, cached['metadata']
+        SpellParser._remove_cache_entry(cache_dir)
+
+        # Drop entries left behind by bundles that have since been rebuilt or removed
+        BUNDLE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        SpellParser._prune_bundle_cache(keep=sigil_hash)
+
+        # Extract next to the cache entry so it can be renamed into place atomically
+        staging_dir = Path(tempfile.mkdtemp(prefix='.staging_', dir=BUNDLE_CACHE_DIR))
+        try:
+            _, metadata = SpellParser.parse_bundle(spell_path, extract_dir=staging_dir,
+                                                   sigil_verification=sigil_verification)
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        SpellParser._make_read_only(staging_dir)
+        try:
+            os.replace(staging_dir, cache_dir)
+        except OSError:
+            # Another run populated the entry first; use a private copy this time
+            SpellParser._remove_cache_entry(staging_dir)
+            return SpellParser.parse_bundle(spell_path,
+                                            extract_dir=make_scratch_dir() if make_scratch_dir else None,
+                                            sigil_verification=sigil_verification)
+
+        sidecar_path.write_text(json.dumps({
+            'bundle_path': os.path.realpath(spell_path),
+            'bundle_stamp': bundle_stamp,
+            'metadata': metadata
+        }, default=str))
+        return cache_dir, metadata
+
+    @staticmethod
+    def _cache_entry_intact(cache_dir: Path, sigil_hash: str, sigil_verification: Dict[str, Any]) -> bool:
+        """Rehash a cached extraction with the bundle's own metadata and compare it to the sigil."""
+        bundle_metadata = sigil_verification.get('metadata') or {}
+        try:
+            current_hash = Sigildry.generate_sigil_hash(
+                spell_name=bundle_metadata.get('name', ''),
+                description=bundle_metadata.get('description', ''),
+                spell_type=bundle_metadata.get('type', 'generic'),
+                version=bundle_metadata.get('version', '1.0.0'),
+                entry_point=bundle_metadata.get('entry_point', ''),
+                shell_type=bundle_metadata.get('shell_type', ''),
+                spell_dir=cache_dir
+            )
+        except OSError:
+            return False
+        return current_hash == sigil_hash
+
+    @staticmethod
+    def _make_read_only(root: Path) -> None:
+        """Clear the write bits on an extracted tree so spells cannot alter their cached copy."""
+        for file_path, _ in iter_spell_files(root):
+            os.chmod(file_path, os.stat(file_path).st_mode & ~0o222)
+        directories = [dirpath for dirpath, _, _ in os.walk(root)]
+        for directory in reversed(directories):
+            os.chmod(directory, os.stat(directory).st_mode & ~0o222)
+
+    @staticmethod
+    def _remove_cache_entry(path: Path) -> None:
+        """Delete a cached extraction, restoring write access wherever removal is refused."""
+        def make_writable(func, failed_path, _):
+            try:
+                os.chmod(os.path.dirname(failed_path), 0o700)
+                os.chmod(failed_path, 0o700)
+                func(failed_path)
+            except OSError:
+                pass
+
+        if not os.path.lexists(path):
+            return
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=make_writable)
+        else:
+            shutil.rmtree(path, onerror=make_writable)
+
+    @staticmethod
+    def _prune_bundle_cache(keep: str) -> None:
+        """Remove cached extractions whose bundle is gone or no longer matches its recorded stamp."""
+        with os.scandir(BUNDLE_CACHE_DIR) as entries:
+            sidecars = [entry for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+        for sidecar in sidecars:
+            sigil_hash = sidecar.name[:-len('.json')]
+            if sigil_hash == keep:
+                continue
+            try:
+                cached = json_loads(Path(sidecar.path).read_bytes())
+                stat = os.stat(cached['bundle_path'])
+                if cached.get('bundle_stamp') == [stat.st_size, stat.st_mtime_ns]:
+                    continue
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+            SpellParser._remove_cache_entry(BUNDLE_CACHE_DIR / sigil_hash)
+            try:
+                os.remove(sidecar.path)
+            except FileNotFoundError:
+                pass
                 
     @staticmethod
     def _validate_metadata(metadata: Dict[str, Any]) -> None:
@@ -84,28 +248,24 @@ class SpellParser:
             metadata['entry_point'] = metadata['main_script']
         
         # Check required fields
-        missing = [field for field in SpellParser.REQUIRED_FIELDS if field not in metadata]
+        missing = sorted(SpellParser.REQUIRED_FIELDS - metadata.keys())
         if missing:
-            error_msg = click.style("Missing required metadata fields: ", fg="bright_red") + \
-                       click.style(", ".join(missing), fg="red", bold=True)
+            error_msg = INVALID_TEMPLATE.format(label="Missing required metadata fields: ", detail=", ".join(missing))
             raise ValueError(error_msg)
             
         # Add type validation that supports all spell types    
         if metadata.get('type') not in SpellParser.ALLOWED_TYPES:
-            error_msg = click.style("Invalid spell type: ", fg="bright_red") + \
-                       click.style(metadata.get('type'), fg="red", bold=True)
+            error_msg = INVALID_TEMPLATE.format(label="Invalid spell type: ", detail=metadata.get('type'))
             raise ValueError(error_msg)
             
         if metadata.get('shell_type') not in SpellParser.ALLOWED_SHELLS:
-            error_msg = click.style("Invalid shell type: ", fg="bright_red") + \
-                       click.style(metadata.get('shell_type'), fg="red", bold=True)
+            error_msg = INVALID_TEMPLATE.format(label="Invalid shell type: ", detail=metadata.get('shell_type'))
             raise ValueError(error_msg)
             
         # Check entry point extension
         entry_point = Path(metadata['entry_point'])
         if entry_point.suffix not in SpellParser.ALLOWED_EXTENSIONS:
-            error_msg = click.style("Invalid entry point file type: ", fg="bright_red") + \
-                       click.style(metadata['entry_point'], fg="red", bold=True)
+            error_msg = INVALID_TEMPLATE.format(label="Invalid entry point file type: ", detail=metadata['entry_point'])
             raise ValueError(error_msg)
 
     @staticmethod
@@ -257,172 +417,144 @@ class SpellParser:
             bool: True if spell execution was successful, False otherwise
         """
         try:
-            # Resolve spell path in .tome directory
-            tome_path = Path(SANCTUM_PATH) / '.tome'
-            spell_path = tome_path / f"{spell_name}.spell"
-            
-            if not spell_path.exists():
-                click.echo(click.style("Error: ", fg="bright_red") + 
-                         click.style(f"Spell '{spell_name}' not found", fg="red"))
-                return False
-            
-            # Verify spell sigil using Sigildry
-            sigil_verification = Sigildry.verify_sigil(spell_path)
-            
-            # Parse the spell bundle
-            try:
-                if verbose >= 2:
-                    click.echo("\nExtracting spell bundle:")
-                    click.echo(f"  From: {spell_path}")
+            # Uncached extractions go to a scratch directory, created on demand and always cleaned up
+            with contextlib.ExitStack() as cleanup:
+                # Resolve spell path in .tome directory
+                tome_path = Path(SANCTUM_PATH) / '.tome'
+                spell_path = tome_path / f"{spell_name}.spell"
                 
-                temp_dir, metadata = SpellParser.parse_bundle(spell_path)
+                if not spell_path.exists():
+                    click.echo(ERROR_TEMPLATE.format(label="Error: ", detail=f"Spell '{spell_name}' not found"))
+                    return False
                 
-                if verbose >= 2:
-                    click.echo(f"  To: {temp_dir}")
-                    click.echo("\nListing extracted files:")
-                    for root, dirs, files in os.walk(temp_dir):
-                        rel_path = os.path.relpath(root, temp_dir)
-                        if rel_path == '.':
-                            for f in files:
-                                click.echo(f"  - {f}")
-                        else:
-                            for f in files:
-                                click.echo(f"  - {rel_path}/{f}")
-            except Exception as e:
-                click.echo(click.style("Error parsing spell bundle: ", fg="bright_red") + 
-                         click.style(str(e), fg="red"))
-                return False
-            
-            # Level 1 verbosity (basic info)
-            if verbose >= 1:
-                click.echo(click.style("\nSpell Details:", fg="bright_blue", bold=True))
-                click.echo(click.style("  » Name: ", fg="cyan") + f"{metadata['name']}")
-                click.echo(click.style("  » Type: ", fg="cyan") + f"{metadata['type']}")
-                click.echo(click.style("  » Description: ", fg="cyan") + f"{metadata['description']}")
-                click.echo(click.style("  » Version: ", fg="cyan") + f"{metadata['version']}\n")
-
-            # For other spell types, locate the entry point script
-            entry_point_name = metadata.get('entry_point')
-            if not entry_point_name:
-                click.echo(click.style("Error: ", fg="bright_red") + 
-                         click.style("No entry point found in spell metadata", fg="red"))
-                return False
-            
-            # Find the actual entry point file
-            entry_point_candidates = [
-                temp_dir / 'spell' / entry_point_name,  # Primary location in spell/
-                temp_dir / entry_point_name,  # Fallback to root
-                temp_dir / 'spell' / 'spell' / entry_point_name  # Legacy location
-            ]
-            
-            if verbose >= 2:
-                click.echo("\nSearching for entry point:")
-                for path in entry_point_candidates:
-                    click.echo(f"  Checking: {path}")
-                    if path.exists():
-                        click.echo(f"  Found at: {path}")
-                        break
-            
-            entry_point = next((path for path in entry_point_candidates if path.exists()), None)
-            
-            if not entry_point:
-                click.echo(click.style("Error: ", fg="bright_red") + 
-                         click.style(f"Entry point {entry_point_name} not found", fg="red"))
-                return False
-            
-            # Make the script executable if it's a shell script
-            if entry_point.suffix == '.sh':
-                entry_point.chmod(0o755)
-            
-            # Determine execution method based on file type
-            shell_type = metadata.get('shell_type', 'python')
-            
-            try:
-                if shell_type == 'python':
-                    # Use subprocess to run Python script
-                    result = subprocess.run(
-                        [sys.executable, str(entry_point), *args], 
-                        capture_output=True, 
-                        text=True
-                    )
+                # Verify spell sigil using Sigildry
+                sigil_verification = Sigildry.verify_sigil(spell_path)
+                
+                # Parse the spell bundle
+                try:
+                    if verbose >= 2:
+                        click.echo("\nExtracting spell bundle:")
+                        click.echo(f"  From: {spell_path}")
                     
-                    # Handle Python script output
-                    if result.stdout:
-                        click.echo(result.stdout)
-                    if result.stderr:
-                        click.echo(result.stderr, err=True)
+                    temp_dir, metadata = SpellParser.parse_bundle_cached(
+                        spell_path, sigil_verification,
+                        lambda: Path(cleanup.enter_context(tempfile.TemporaryDirectory(prefix='magi_spell_'))))
                     
-                    # Check return code
-                    if result.returncode != 0:
-                        click.echo(click.style("Python spell execution failed with code ", fg="bright_red") + 
-                                 click.style(str(result.returncode), fg="red"))
-                        return False
+                    if verbose >= 2:
+                        click.echo(f"  To: {temp_dir}")
+                        click.echo("\nListing extracted files:")
+                        for name in metadata.get('_bundle_files', []):
+                            click.echo(f"  - {name}")
+                except Exception as e:
+                    click.echo(ERROR_TEMPLATE.format(label="Error parsing spell bundle: ", detail=str(e)))
+                    return False
                 
-                elif shell_type in ['bash', 'shell']:
-                    # Use os.system to run shell script
-                    exit_code = os.system(f"bash {entry_point}")
-                    
-                    if exit_code != 0:
-                        click.echo(click.style("Shell spell execution failed with code ", fg="bright_red") + 
-                                 click.style(str(exit_code), fg="red"))
-                        return False
+                # Level 1 verbosity (basic info)
+                if verbose >= 1:
+                    click.echo(click.style("\nSpell Details:", fg="bright_blue", bold=True))
+                    click.echo(click.style("  » Name: ", fg="cyan") + f"{metadata['name']}")
+                    click.echo(click.style("  » Type: ", fg="cyan") + f"{metadata['type']}")
+                    click.echo(click.style("  » Description: ", fg="cyan") + f"{metadata['description']}")
+                    click.echo(click.style("  » Version: ", fg="cyan") + f"{metadata['version']}\n")
+
+                # For other spell types, locate the entry point script
+                entry_point_name = metadata.get('entry_point')
+                if not entry_point_name:
+                    click.echo(ERROR_TEMPLATE.format(label="Error: ", detail="No entry point found in spell metadata"))
+                    return False
+                
+                # Use the entry point location resolved while parsing the bundle
+                resolved_entry = metadata.get('_resolved_entry')
+                entry_point = temp_dir / resolved_entry if resolved_entry else None
                 
-                else:
-                    click.echo(click.style("Unsupported shell type: ", fg="bright_red") + 
-                             click.style(shell_type, fg="red"))
+                if verbose >= 2 and entry_point:
+                    click.echo(f"\nEntry point found at: {entry_point}")
+                
+                if not entry_point:
+                    click.echo(ERROR_TEMPLATE.format(label="Error: ", detail=f"Entry point {entry_point_name} not found"))
                     return False
-            
-            except Exception as e:
-                click.echo(click.style("Execution error: ", fg="bright_red") + 
-                         click.style(str(e), fg="red"))
-                return False
-            
-            # Level 2 verbosity (detailed metadata)
-            if verbose >= 2:
-                click.echo(click.style("\nDetailed Spell Metadata:", fg="bright_blue", bold=True))
-                for key, value in metadata.items():
-                    # Skip empty or None values
-                    if value is None or (isinstance(value, (str, list, dict)) and len(value) == 0):
-                        continue
+                
+                # Make the script executable if it's a shell script
+                if entry_point.suffix == '.sh':
+                    entry_point.chmod(0o555)
+                
+                # Determine execution method based on file type
+                shell_type = metadata.get('shell_type', 'python')
+                
+                try:
+                    if shell_type == 'python':
+                        command = [sys.executable, str(entry_point), *args]
+                        if verbose >= 2:
+                            # Relay output line by line as it arrives; stderr goes straight through
+                            with subprocess.Popen(command, stdout=subprocess.PIPE, text=True, bufsize=1) as proc:
+                                for line in proc.stdout:
+                                    click.echo(line, nl=False)
+                            returncode = proc.returncode
+                        else:
+                            # Let the spell inherit the terminal so it can be interactive
+                            returncode = subprocess.run(command).returncode
+                        
+                        # Check return code
+                        if returncode != 0:
+                            click.echo(ERROR_TEMPLATE.format(label="Python spell execution failed with code ", detail=str(returncode)))
+                            return False
                     
-                    # Skip code display and sigil verification (will show separately)
-                    if key in ['code', 'sigil_verification']:
-                        continue
+                    elif shell_type in ['bash', 'shell']:
+                        # Run the shell script directly with its arguments
+                        exit_code = subprocess.run(['bash', str(entry_point), *args]).returncode
+                        
+                        if exit_code != 0:
+                            click.echo(ERROR_TEMPLATE.format(label="Shell spell execution failed with code ", detail=str(exit_code)))
+                            return False
                     
-                    # Special handling for nested dictionaries
-                    if isinstance(value, dict):
-                        click.echo(click.style("  " + key.upper() + ": ", fg="cyan", bold=True))
-                        for sub_key, sub_value in value.items():
-                            # Skip empty or None sub-values
-                            if sub_value is not None and not (isinstance(sub_value, (str, list, dict)) and len(sub_value) == 0):
-                                click.echo(click.style("    " + sub_key + ": ", fg="bright_white") + str(sub_value))
                     else:
-                        click.echo(click.style("  " + key.upper() + ": ", fg="cyan") + str(value))
+                        click.echo(ERROR_TEMPLATE.format(label="Unsupported shell type: ", detail=shell_type))
+                        return False
                 
-                # Add sigil verification details
-                click.echo(click.style("\n  SIGIL VERIFICATION:", fg="bright_blue"))
-                verification_details = sigil_verification
-                for sub_key, sub_value in verification_details.items():
-                    if sub_key != 'metadata':  # Skip nested metadata
-                        click.echo(click.style("    " + sub_key.upper() + ": ", fg="bright_white") + str(sub_value))
+                except Exception as e:
+                    click.echo(ERROR_TEMPLATE.format(label="Execution error: ", detail=str(e)))
+                    return False
+                
+                # Level 2 verbosity (detailed metadata)
+                if verbose >= 2:
+                    click.echo(click.style("\nDetailed Spell Metadata:", fg="bright_blue", bold=True))
+                    for key, value in metadata.items():
+                        # Skip empty or None values
+                        if value is None or (isinstance(value, (str, list, dict)) and len(value) == 0):
+                            continue
+                        
+                        # Skip code display, sigil verification (shown separately) and internal keys
+                        if key in ['code', 'sigil_verification'] or key.startswith('_'):
+                            continue
+                        
+                        # Special handling for nested dictionaries
+                        if isinstance(value, dict):
+                            click.echo(click.style("  " + key.upper() + ": ", fg="cyan", bold=True))
+                            for sub_key, sub_value in value.items():
+                                # Skip empty or None sub-values
+                                if sub_value is not None and not (isinstance(sub_value, (str, list, dict)) and len(sub_value) == 0):
+                                    click.echo(click.style("    " + sub_key + ": ", fg="bright_white") + str(sub_value))
+                        else:
+                            click.echo(click.style("  " + key.upper() + ": ", fg="cyan") + str(value))
+                    
+                    # Add sigil verification details
+                    click.echo(click.style("\n  SIGIL VERIFICATION:", fg="bright_blue"))
+                    verification_details = sigil_verification
+                    for sub_key, sub_value in verification_details.items():
+                        if sub_key != 'metadata':  # Skip nested metadata
+                            click.echo(click.style("    " + sub_key.upper() + ": ", fg="bright_white") + str(sub_value))
+                
+                if verbose:
+                    click.echo(click.style("✨ Spell executed successfully", fg="bright_green"))
+                return True
             
-            if verbose:
-                click.echo(click.style("✨ Spell executed successfully", fg="bright_green"))
-            return True
-        
         except Exception as e:
-            click.echo(click.style("Unexpected error executing spell: ", fg="bright_red") + 
-                     click.style(str(e), fg="red"))
+            click.echo(ERROR_TEMPLATE.format(label="Unexpected error executing spell: ", detail=str(e)))
             if verbose:
                 import traceback
                 click.echo(click.style("\nDetailed Error:", fg="bright_red"))
                 click.echo(click.style(traceback.format_exc(), fg="red"))
             return False
-        finally:
-            # Clean up temporary directory
-            import shutil
-            if 'temp_dir' in locals() and Path(temp_dir).exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
 
     @staticmethod
     def execute_python_file(script_path: str, args=None, verbose: bool = False) -> bool:
@@ -488,8 +620,8 @@ class SpellParser:
                 click.echo(click.style("Bash Script Execution:", fg="bright_blue", bold=True))
                 click.echo(click.style("  Script Path: ", fg="cyan") + f"{script_path}")
             
-            # Execute using system shell
-            exit_code = os.system(f"bash {script_path}")
+            # Execute with bash directly
+            exit_code = subprocess.run(['bash', str(script_path)]).returncode
             
             if exit_code != 0:
                 if verbose:
@@ -1,6 +1,8 @@
 import os
+import json
 import pkgutil
 import importlib
+import click
 
 # Set default SANCTUM_PATH to the user's home directory if SANCTUM_PATH is not in the environment
 SANCTUM_PATH = os.getenv('SANCTUM_PATH', os.path.join(os.path.expanduser('~'), '.sanctum'))
@@ -17,17 +19,80 @@ if not os.path.exists(SANCTUM_PATH):
 TOME_PATH = os.path.join(SANCTUM_PATH, '.tome')
 RUNE_DIR = os.path.join(SANCTUM_PATH, '.runes')
 
+# Cached spell names, aliases and help, so commands are imported only when cast
+SPELL_MANIFEST_PATH = os.path.join(SANCTUM_PATH, '.spell_manifest.json')
+SPELL_MANIFEST_VERSION = 2
+
+class LazySpell(click.Command):
+    """Stand-in for a spell command that imports its module on first use."""
+
+    def __init__(self, module_name, name, help=None):
+        super().__init__(name, help=help)
+        self.module_name = module_name
+
+    def load(self):
+        """Import the spell module and return its real command."""
+        return vars(importlib.import_module('.' + self.module_name, __package__))[self.module_name]
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+def load_command(command):
+    """Return the real click command behind a possibly lazy spell command."""
+    return command.load() if isinstance(command, LazySpell) else command
+
+def _spell_manifest():
+    """Load the spell manifest, rebuilding it by importing every spell when stale."""
+    # Stamp each spell module by mtime; listing the package is cheap, importing is not
+    stamp = {}
+    for module_finder, module_name, ispkg in pkgutil.walk_packages(__path__):
+        # Stamp whatever file the module loads from (.py, .pyc or extension); None if there is none
+        spec = module_finder.find_spec(module_name)
+        origin = spec.origin if spec else None
+        try:
+            stamp[module_name] = os.stat(origin).st_mtime_ns if origin else None
+        except OSError:
+            stamp[module_name] = None
+
+    try:
+        with open(SPELL_MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == SPELL_MANIFEST_VERSION and manifest.get('stamp') == stamp:
+            return manifest['spells']
+    except (OSError, ValueError):
+        pass
+
+    spells = {}
+    for module_name in stamp:
+        _module = importlib.import_module('.' + module_name, __package__)
+        command = vars(_module)[module_name]
+        spells[module_name] = {
+            'name': command.name,
+            'alias': getattr(_module, 'alias', None),
+            'help': command.help
+        }
+    try:
+        with open(SPELL_MANIFEST_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'version': SPELL_MANIFEST_VERSION, 'stamp': stamp, 'spells': spells}, f)
+    except OSError:
+        pass
+    return spells
+
 __all__ = []
 commands_list = []  # List to store command functions
 aliases = {}  # Dictionary to store aliases
 
-for _, module_name, _ in pkgutil.walk_packages(__path__):
+for module_name, entry in _spell_manifest().items():
     __all__.append(module_name)
-    # Dynamically import the module
-    _module = importlib.import_module('.' + module_name, __package__)
-    globals()[module_name] = _module
-    # Add command function to commands_list
-    commands_list.append(vars(_module)[module_name])
+    # Add a lazily imported command function to commands_list
+    command = LazySpell(module_name, entry['name'], help=entry['help'])
+    commands_list.append(command)
     # Collect aliases if present in the module
-    if hasattr(_module, 'alias'):
-        aliases[_module.alias] = vars(_module)[module_name]
\ No newline at end of file
+    if entry['alias']:
+        aliases[entry['alias']] = command
+
+def __getattr__(name):
+    # Import spell modules on attribute access, as the eager loader used to
+    if name in __all__:
+        return importlib.import_module('.' + name, __package__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,30 +1,35 @@
 import click
 import os
+import sys
 import shutil
 
+# Exile directory: /tmp on Unix systems, C:\temp on Windows
+EXILE_DIR = "C:\\temp\\.exile" if sys.platform == "win32" else "/tmp/.exile"
+
 @click.command()
 @click.argument('args', nargs=-1, required=True)  # Accepts multiple file paths
 def banish(args):
-    ''' 'bn' - Banish a target to the /tmp directory in a .exile folder. If no /tmp directory exists, place it in a C:\\temp\\.exile directory.'''
+    ''' 'bn' - Banish targets to a /tmp/.exile folder, or to C:\\temp\\.exile on Windows.'''
     
     if not args:
         click.echo("Error: No file path provided.")
         return
 
-    # Handle the first file path from the list
-    file_path = args[0]
-
-    # Check if /tmp exists (Unix systems) or use C:\temp (Windows)
-    if os.path.exists("/tmp"):
-        exile_dir = "/tmp/.exile"
-    else:
-        exile_dir = "C:\\temp\\.exile"
-
-    if not os.path.exists(exile_dir):
-        os.makedirs(exile_dir)
-
-    shutil.move(file_path, os.path.join(exile_dir, os.path.basename(file_path)))
-    click.echo(f"{file_path} has been banished to the {exile_dir} directory in a .exile folder.")
+    os.makedirs(EXILE_DIR, exist_ok=True)
+
+    # Banish every file path provided
+    for file_path in args:
+        destination = os.path.join(EXILE_DIR, os.path.basename(file_path))
+        try:
+            try:
+                # A plain rename when the exile directory is on the same filesystem
+                os.replace(file_path, destination)
+            except OSError:
+                shutil.move(file_path, destination)
+        except OSError as e:
+            click.echo(f"{file_path} resists banishment: {e}")
+            continue
+        click.echo(f"{file_path} has been banished to the {EXILE_DIR} directory in a .exile folder.")
 
 alias = "bn"
 
@@ -1,33 +1,143 @@
 import click
 import os
+import re
+import time
 import fnmatch
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Stat this many entries or more on a small thread pool; fewer are not worth the threads
+PARALLEL_STAT_MIN = 100
+
+# Search results are echoed in batches of this many lines
+OUTPUT_CHUNK_LINES = 4096
+
+# Threads scanning directories during a search. Helps on network filesystems
+# and spinning disks; the default of 1 keeps the walk serial.
+try:
+    DIVINE_JOBS = max(1, int(os.getenv('MAGI_DIVINE_JOBS', '1')))
+except ValueError:
+    DIVINE_JOBS = 1
+
+def _name_matcher(search_term):
+    """Build a predicate matching names like fnmatch against '*search_term*'."""
+    # Plain terms need only a substring test; normcase keeps fnmatch's case rules
+    needle = os.path.normcase(search_term)
+    if not any(c in search_term for c in '*?['):
+        return lambda name: needle in os.path.normcase(name)
+    match = re.compile(fnmatch.translate(f'*{needle}*')).match
+    return lambda name: match(os.path.normcase(name)) is not None
+
+def _scan(path, skip_dirs):
+    """Split one directory into its file DirEntries and the subdirectory paths to descend into."""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink() and entry.name not in skip_dirs:
+                        subdirs.append(entry.path)
+                else:
+                    files.append(entry)
+    except OSError:
+        # Skip directories that cannot be listed, as os.walk does
+        return [], []
+    return files, subdirs
+
+def _walk(root, skip_dirs=frozenset(), jobs=1):
+    """Yield the file DirEntries of each directory under root, in os.walk order.
+
+    Symlinked directories are not followed and directories named in skip_dirs are pruned.
+    With jobs > 1, subdirectories are scanned ahead on a thread pool; the order is unchanged.
+    """
+    if jobs <= 1:
+        stack = [root]
+        while stack:
+            files, subdirs = _scan(stack.pop(), skip_dirs)
+            yield files
+            # Descend in listing order, as os.walk does
+            stack.extend(reversed(subdirs))
+        return
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        stack = [executor.submit(_scan, root, skip_dirs)]
+        while stack:
+            files, subdirs = stack.pop().result()
+            yield files
+            stack.extend(reversed([executor.submit(_scan, path, skip_dirs) for path in subdirs]))
+
+def _stat_entry(entry):
+    """Stat a DirEntry, falling back to the link itself for dangling symlinks; None if both fail."""
+    try:
+        return entry.stat()
+    except OSError:
+        pass
+    try:
+        return entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+
+def _stat_by_inode(entries):
+    """Stat DirEntries in inode order, keeping cold-cache metadata reads near-sequential.
+
+    Entries that cannot be stat'ed at all map to None.
+    """
+    ordered = sorted(entries, key=lambda entry: entry.inode())
+    if len(ordered) < PARALLEL_STAT_MIN:
+        return {entry.path: _stat_entry(entry) for entry in ordered}
+    # stat releases the GIL, so a few workers overlap the syscalls
+    with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+        stats = executor.map(_stat_entry, ordered)
+        return {entry.path: file_stat for entry, file_stat in zip(ordered, stats)}
 
 @click.command()
 @click.argument('args', nargs=-1, required=False)  # Use args to accept variable number of arguments
 def divine(args):
-    """ 'dv' - List the directory contents with detailed information, or find a file anywhere below the root directory, searching through child directories, and echo its path."""
+    """ 'dv' - List the directory contents with detailed information, or find a file anywhere below the root directory, searching through child directories, and echo its path. Any further arguments name directories to skip while searching."""
     
     search_term = args[0] if args else None
+    skip_dirs = frozenset(args[1:])  # Directory names pruned from the search, e.g. node_modules
 
     if search_term:
         click.echo(f"You cast your senses into the ether, seeking knowledge of the realm...\n")
-        for root, dirs, files in os.walk('.'):
-            for file in files:
-                if fnmatch.fnmatch(file, f'*{search_term}*'):
-                    file_path = os.path.join(root, file)
-                    file_size = os.path.getsize(file_path)
-                    file_permissions = oct(os.stat(file_path).st_mode)[-3:]
-                    file_modified = datetime.fromtimestamp(os.path.getmtime(file_path)).strftime('%Y-%m-%d %H:%M:%S')
-                    click.echo(f"{file_path}\tSize: {file_size} bytes\tPermissions: {file_permissions}\tLast Modified: {file_modified}")
+        matches_name = _name_matcher(search_term)
+        # Walk with scandir so directory checks and stats reuse each DirEntry;
+        # names are matched before any stat so non-matches cost no metadata reads
+        lines = []
+        try:
+            for files in _walk('.', skip_dirs, DIVINE_JOBS):
+                matches = [entry for entry in files if matches_name(entry.name)]
+                stats = _stat_by_inode(matches)
+                for match in matches:
+                    file_stat = stats[match.path]
+                    if file_stat is None:
+                        continue
+                    file_permissions = oct(file_stat.st_mode)[-3:]
+                    file_modified = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(file_stat.st_mtime))
+                    lines.append(f"{match.path}\tSize: {file_stat.st_size} bytes\tPermissions: {file_permissions}\tLast Modified: {file_modified}")
+                if len(lines) >= OUTPUT_CHUNK_LINES:
+                    click.echo("\n".join(lines))
+                    lines.clear()
+        finally:
+            # Never lose matches already found, even if the walk fails
+            if lines:
+                click.echo("\n".join(lines))
     else:
         click.echo(f"You cast your senses into the ether, seeking knowledge of the realm...\n")
-        for file in os.listdir("."):
-            file_path = os.path.join(".", file)
-            file_size = os.path.getsize(file_path)
-            file_permissions = oct(os.stat(file_path).st_mode)[-3:]
-            file_modified = datetime.fromtimestamp(os.path.getmtime(file_path)).strftime('%Y-%m-%d %H:%M:%S')
-            click.echo(f"{file}\tSize: {file_size} bytes\tPermissions: {file_permissions}\tLast Modified: {file_modified}")
+        # One stat per entry via scandir, echoed in a single write
+        lines = []
+        with os.scandir(".") as entries:
+            entries = list(entries)
+        stats = _stat_by_inode(entries)
+        for entry in entries:
+            file_stat = stats[entry.path]
+            if file_stat is None:
+                continue
+            file_permissions = oct(file_stat.st_mode)[-3:]
+            file_modified = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(file_stat.st_mtime))
+            lines.append(f"{entry.name}\tSize: {file_stat.st_size} bytes\tPermissions: {file_permissions}\tLast Modified: {file_modified}")
+        if lines:
+            click.echo("\n".join(lines))
 
 alias = "dv"
 
@@ -1,6 +1,8 @@
 import click
 import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from magi_cli.spells import SANCTUM_PATH 
 
 @click.command()
@@ -14,31 +16,58 @@ def fireball(args):
         click.echo("There are no graveyards available. Unable to cast fireball.")
         return  # Break out of the function
 
+    targets = []
+    aborted = False
     for file_path in args:  # Iterate over each file path provided
-        if os.path.exists(file_path):
-            click.echo(f"Your hands tremble as you draw upon the arcane energies...\n")
-
-            # Check whether the path is a file or a directory
-            if os.path.isfile(file_path):
-                confirmation_prompt = "Are you sure you want to continue? A target sent to the graveyard is as dead as can be."
-            elif os.path.isdir(file_path):
-                confirmation_prompt = "You are about to incinerate a directory and everything within it, sending it to the graveyard. Are you sure you want to continue?"
-            else:
-                confirmation_prompt = "Are you sure you want to continue? A target sent to the graveyard is as dead as can be."
-            
-            if click.confirm(confirmation_prompt, abort=True):
-                click.echo("You cast the spell and a fireball erupts from your hands, engulfing the target in flames...")
-                click.echo("When the smoke clears, nothing remains but cinder and ash.")
-                destination_path = os.path.join(graveyard_path, os.path.basename(file_path))
-                shutil.move(file_path, destination_path)
-
-                # Clean up the graveyard if it has more than 13 files
-                files_in_graveyard = os.listdir(graveyard_path)
-                if len(files_in_graveyard) > 13:
-                    files_in_graveyard.sort(key=lambda x: os.path.getmtime(os.path.join(graveyard_path, x)))
-                    os.remove(os.path.join(graveyard_path, files_in_graveyard[0]))
-        else:
+        try:
+            target_mode = os.stat(file_path).st_mode
+        except OSError:
             click.echo(f"Your fireball fizzles... The target at {file_path} does not exist. Even in the arcane arts, one cannot destroy what is already absent.")
+            continue
+
+        click.echo(f"Your hands tremble as you draw upon the arcane energies...\n")
+
+        # Check whether the path is a file or a directory
+        if stat.S_ISDIR(target_mode):
+            confirmation_prompt = "You are about to incinerate a directory and everything within it, sending it to the graveyard. Are you sure you want to continue?"
+        else:
+            confirmation_prompt = "Are you sure you want to continue? A target sent to the graveyard is as dead as can be."
+        
+        try:
+            click.confirm(confirmation_prompt, abort=True)
+        except click.Abort:
+            # Targets already confirmed still burn before the spell is abandoned
+            aborted = True
+            break
+        click.echo("You cast the spell and a fireball erupts from your hands, engulfing the target in flames...")
+        targets.append(file_path)
+
+    if targets:
+        # Prompts are done; send every confirmed target to the graveyard at once
+        if len(targets) == 1:
+            _send_to_graveyard(targets[0], graveyard_path)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+                list(executor.map(lambda target: _send_to_graveyard(target, graveyard_path), targets))
+        for _ in targets:
+            click.echo("When the smoke clears, nothing remains but cinder and ash.")
+
+        # Clean up the graveyard if it has more than 13 files
+        with os.scandir(graveyard_path) as entries:
+            files_in_graveyard = sorted(entries, key=lambda entry: entry.stat().st_mtime)
+        for oldest in files_in_graveyard[:max(0, len(files_in_graveyard) - 13)]:
+            os.remove(oldest.path)
+
+    if aborted:
+        raise click.Abort()
+
+def _send_to_graveyard(file_path, graveyard_path):
+    destination_path = os.path.join(graveyard_path, os.path.basename(file_path))
+    try:
+        os.replace(file_path, destination_path)
+    except OSError:
+        # Cross-device (EXDEV) or an existing spirit of the same name; let shutil sort it out
+        shutil.move(file_path, destination_path)
 
 alias = "fb"
 
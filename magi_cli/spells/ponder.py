@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 
 import click
-import inspect
 import os
 import sys
 import glob
 import requests
+from requests.adapters import HTTPAdapter
 import subprocess
 import ast
 import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, Any, Tuple, List
 from magi_cli.spells import SANCTUM_PATH
 from pathlib import Path
@@ -17,6 +19,11 @@ class SpellRegistry:
     def __init__(self, chamber_url: str = "https://magi-chamber.fly.dev"):
         self.chamber_url = chamber_url.rstrip('/')
         self.orb_dir = os.path.join(SANCTUM_PATH, '.orb')
+        self._manifest = None
+        # One pooled session so every chamber request reuses the same connection
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=16))
+        self.session.mount('http://', HTTPAdapter(pool_maxsize=16))
         # Get the magi_cli spells directory
         self.spells_dir = self._get_spells_dir()
         os.makedirs(self.orb_dir, exist_ok=True)
@@ -26,29 +33,47 @@ class SpellRegistry:
         """Get the spells directory from the magi_cli package."""
         try:
             from magi_cli import spells
-            spells_dir = os.path.dirname(inspect.getfile(spells))
+            spells_dir = os.path.dirname(spells.__file__)
             return spells_dir
         except ImportError:
             click.echo("Warning: Could not find magi_cli spells directory")
             return os.path.join(os.getcwd(), 'spells')
 
+    @functools.cached_property
+    def record_path(self) -> Optional[str]:
+        """Locate the installed distribution's RECORD file once per registry."""
+        site_packages = os.path.dirname(os.path.dirname(self.spells_dir))
+        dist_info_pattern = os.path.join(site_packages, "magi_cli_pypi-*.dist-info")
+        dist_info_dirs = glob.glob(dist_info_pattern)
+        if not dist_info_dirs:
+            return None
+        return os.path.join(dist_info_dirs[0], "RECORD")
+
     def fetch_spell_manifest(self) -> Optional[Dict[str, Any]]:
-        """Fetch the spell manifest from the chamber."""
+        """Fetch the spell manifest from the chamber, reusing it once fetched."""
+        if self._manifest is not None:
+            return self._manifest
         try:
-            response = requests.get(f"{self.chamber_url}/manifest")
+            response = self.session.get(f"{self.chamber_url}/manifest")
             response.raise_for_status()
-            return response.json()
+            self._manifest = response.json()
+            return self._manifest
         except requests.RequestException as e:
             click.echo(f"Failed to contact the chamber: {e}")
             return None
 
+    def refresh_manifest(self) -> Optional[Dict[str, Any]]:
+        """Drop the cached manifest and fetch a fresh one from the chamber."""
+        self._manifest = None
+        return self.fetch_spell_manifest()
+
     def fetch_spell(self, spell_name: str) -> Optional[Tuple[str, str, List[str]]]:
         """
         Fetch a specific spell from the chamber.
         Returns tuple of (content, hash, requirements) if successful, None if failed.
         """
         try:
-            response = requests.get(f"{self.chamber_url}/spells/{spell_name}.py")
+            response = self.session.get(f"{self.chamber_url}/spells/{spell_name}.py")
             response.raise_for_status()
             content = response.text
 
@@ -67,6 +92,31 @@ class SpellRegistry:
             click.echo(f"Failed to fetch spell {spell_name}: {e}")
             return None
 
+    def fetch_spell_to(self, spell_name: str, path: str, expected_hash: Optional[str] = None) -> Optional[str]:
+        """
+        Stream a spell from the chamber straight to path.
+        Returns the sha256 of the bytes written if successful, None if failed.
+        When expected_hash is given, a download that does not match it is discarded.
+        """
+        partial_path = path + '.part'
+        hasher = hashlib.sha256()
+        try:
+            with self.session.get(f"{self.chamber_url}/spells/{spell_name}.py", stream=True) as response:
+                response.raise_for_status()
+                with open(partial_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        hasher.update(chunk)
+                        f.write(chunk)
+            if expected_hash and hasher.hexdigest() != expected_hash:
+                raise ValueError("the spell does not match the chamber's hash")
+            os.replace(partial_path, path)
+        except (requests.RequestException, OSError, ValueError) as e:
+            click.echo(f"Failed to fetch spell {spell_name}: {e}")
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            return None
+        return hasher.hexdigest()
+
     def extract_requirements(self, spell_script_content: str) -> List[str]:
         """Extract the __requires__ variable from the spell script content."""
         try:
@@ -127,26 +177,21 @@ class SpellRegistry:
                 Path(init_path).touch()
 
             # Find and update RECORD file
-            site_packages = os.path.dirname(os.path.dirname(self.spells_dir))
-            dist_info_pattern = os.path.join(site_packages, "magi_cli_pypi-*.dist-info")
-            dist_info_dirs = glob.glob(dist_info_pattern)
-
-            if dist_info_dirs:
-                record_path = os.path.join(dist_info_dirs[0], "RECORD")
-                if os.path.exists(record_path):
-                    try:
-                        with open(record_path, 'r', encoding='utf-8') as f:
-                            records = f.readlines()
-
-                        # Add new spell record if not already present
-                        relative_path = "magi_cli/spells/" + f"{spell_name}.py"
-                        if not any(relative_path in record for record in records):
-                            records.append(f"{relative_path},,\n")
-
-                        with open(record_path, 'w', encoding='utf-8') as f:
-                            f.writelines(records)
-                    except Exception as e:
-                        click.echo(f"Warning: Failed to update RECORD file: {e}")
+            record_path = self.record_path
+            if record_path and os.path.exists(record_path):
+                try:
+                    with open(record_path, 'r', encoding='utf-8') as f:
+                        records = f.read()
+
+                    # Append the new spell record if not already present
+                    relative_path = "magi_cli/spells/" + f"{spell_name}.py"
+                    if relative_path not in records:
+                        with open(record_path, 'a', encoding='utf-8') as f:
+                            if records and not records.endswith('\n'):
+                                f.write('\n')
+                            f.write(f"{relative_path},,\n")
+                except Exception as e:
+                    click.echo(f"Warning: Failed to update RECORD file: {e}")
 
             # Try to import the spell to verify installation
             try:
@@ -176,26 +221,22 @@ class SpellRegistry:
             orb_path = os.path.join(self.orb_dir, f"{spell_name}.spell")
             if os.path.exists(orb_path):
                 os.remove(orb_path)
+            if os.path.exists(orb_path + '.sha'):
+                os.remove(orb_path + '.sha')
 
             # Update RECORD file
-            site_packages = os.path.dirname(os.path.dirname(self.spells_dir))
-            dist_info_pattern = os.path.join(site_packages, "magi_cli_pypi-*.dist-info")
-            dist_info_dirs = glob.glob(dist_info_pattern)
-
-            if dist_info_dirs:
-                record_path = os.path.join(dist_info_dirs[0], "RECORD")
-                if os.path.exists(record_path):
-                    # Read existing records
-                    with open(record_path, 'r') as f:
-                        records = f.readlines()
-
-                    # Remove spell record
-                    relative_path = os.path.join("magi_cli", "spells", f"{spell_name}.py")
-                    records = [record for record in records if not record.startswith(relative_path)]
-
-                    # Write updated records
+            record_path = self.record_path
+            if record_path and os.path.exists(record_path):
+                # Read existing records
+                with open(record_path, 'r') as f:
+                    records = f.readlines()
+
+                # Remove spell record, rewriting the file only if it was listed
+                relative_path = os.path.join("magi_cli", "spells", f"{spell_name}.py")
+                kept_records = [record for record in records if not record.startswith(relative_path)]
+                if len(kept_records) != len(records):
                     with open(record_path, 'w') as f:
-                        f.writelines(records)
+                        f.writelines(kept_records)
 
             click.echo(f"\nThe knowledge of '{spell_name}' fades from your mind...")
             click.echo(f"You have unlearned the '{spell_name}' spell.")
@@ -208,6 +249,8 @@ class SpellRegistry:
         """Save a spell to the orb for future reference, including its description."""
         try:
             orb_path = os.path.join(self.orb_dir, f"{spell_name}.spell")
+            if os.path.exists(orb_path + '.sha'):
+                os.remove(orb_path + '.sha')
             with open(orb_path, 'w', encoding='utf-8') as f:
                 if description:
                     f.write(f"# {description}\n")
@@ -220,7 +263,7 @@ class SpellRegistry:
 
     def sync_spells(self) -> None:
         """Synchronize local spell cache with chamber."""
-        manifest = self.fetch_spell_manifest()
+        manifest = self.refresh_manifest()
         if not manifest:
             click.echo("The chamber remains silent. No connection could be established.")
             return
@@ -232,31 +275,39 @@ class SpellRegistry:
 
         click.echo("\nAttuning to the distant chamber's energies...")
 
+        needs_update = []
         for spell_name, spell_info in spells.items():
             local_path = os.path.join(self.orb_dir, f"{spell_name}.spell")
             remote_hash = spell_info.get("hash")
 
-            # Check if we need to update the spell
-            needs_update = True
+            # Check if we need to update the spell, trusting the recorded hash when there is one
             if os.path.exists(local_path):
+                if remote_hash and remote_hash == self._read_sidecar_hash(local_path):
+                    spells_current += 1
+                    continue
                 with open(local_path, 'r') as f:
                     local_content = f.read()
                     if remote_hash == self._calculate_hash(local_content):
-                        needs_update = False
+                        self._write_sidecar_hash(local_path, remote_hash)
                         spells_current += 1
-
-            if needs_update:
-                result = self.fetch_spell(spell_name)
-                if result:
-                    content, _, _ = result
-                    # Save to orb
-                    with open(local_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    spells_synced += 1
-                    click.echo(f"The essence of {spell_name} flows into your orb...")
-                else:
-                    spells_failed += 1
-                    click.echo(f"Failed to grasp {spell_name}...")
+                        continue
+            needs_update.append((spell_name, local_path, remote_hash))
+
+        # Fetch the stale spells concurrently over the shared session
+        if needs_update:
+            with ThreadPoolExecutor(max_workers=min(8, len(needs_update))) as executor:
+                futures = {
+                    executor.submit(self._fetch_and_write, spell_name, local_path, remote_hash): spell_name
+                    for spell_name, local_path, remote_hash in needs_update
+                }
+                for future in as_completed(futures):
+                    spell_name = futures[future]
+                    if future.result():
+                        spells_synced += 1
+                        click.echo(f"The essence of {spell_name} flows into your orb...")
+                    else:
+                        spells_failed += 1
+                        click.echo(f"Failed to grasp {spell_name}...")
 
         # Report results
         if spells_synced == 0 and spells_failed == 0:
@@ -271,14 +322,62 @@ class SpellRegistry:
                 status.append(f"{spells_failed} magics eluded your grasp")
             click.echo("\nThe synchronization ritual is complete: " + ", ".join(status))
 
+    def _fetch_and_write(self, spell_name: str, local_path: str, remote_hash: Optional[str]) -> bool:
+        """Fetch a spell from the chamber into the orb, checking it against remote_hash."""
+        spell_hash = self.fetch_spell_to(spell_name, local_path, remote_hash)
+        if not spell_hash:
+            return False
+        # Only a download verified against the chamber's hash may skip rehashing later
+        if remote_hash:
+            self._write_sidecar_hash(local_path, spell_hash)
+        return True
+
+    def _read_sidecar_hash(self, local_path: str) -> Optional[str]:
+        """Read the chamber hash recorded alongside an orb spell, if the spell is unchanged since."""
+        try:
+            with open(local_path + '.sha', 'r') as f:
+                fields = f.read().split()
+            stat = os.stat(local_path)
+        except OSError:
+            return None
+        # The hash only holds while the spell keeps the size and mtime it had when recorded
+        if len(fields) != 3 or fields[1:] != [str(stat.st_size), str(stat.st_mtime_ns)]:
+            return None
+        return fields[0]
+
+    def _write_sidecar_hash(self, local_path: str, spell_hash: str) -> None:
+        """Record the chamber hash of an orb spell so the next sync can skip rehashing it."""
+        try:
+            stat = os.stat(local_path)
+            with open(local_path + '.sha', 'w') as f:
+                f.write(f"{spell_hash} {stat.st_size} {stat.st_mtime_ns}")
+        except OSError:
+            pass
+
+    def _orb_spells(self) -> List[str]:
+        """List the paths of spells held in the orb with a single directory scan."""
+        try:
+            with os.scandir(self.orb_dir) as entries:
+                return [entry.path for entry in entries if entry.name.endswith('.spell') and entry.is_file()]
+        except FileNotFoundError:
+            return []
+
+    def _installed_spells(self) -> set:
+        """Collect the names of spells installed in the spells directory with a single scan."""
+        try:
+            with os.scandir(self.spells_dir) as entries:
+                return {entry.name[:-3] for entry in entries if entry.name.endswith('.py')}
+        except FileNotFoundError:
+            return set()
+
     def relearn_spells(self) -> None:
         """Reinstall spells from orb that are missing in spells directory."""
-        orb_spells = glob.glob(os.path.join(self.orb_dir, "*.spell"))
+        orb_spells = self._orb_spells()
+        installed_spells = self._installed_spells()
         missing_spells = []
         for orb_spell_path in orb_spells:
             spell_name = os.path.splitext(os.path.basename(orb_spell_path))[0]
-            spell_path = os.path.join(self.spells_dir, f"{spell_name}.py")
-            if not os.path.exists(spell_path):
+            if spell_name not in installed_spells:
                 missing_spells.append(spell_name)
 
         if missing_spells:
@@ -302,7 +401,7 @@ class SpellRegistry:
         """List all available spells with their descriptions."""
         try:
             # Fetch from chamber
-            response = requests.get(f"{self.chamber_url}/spells")
+            response = self.session.get(f"{self.chamber_url}/spells")
             response.raise_for_status()
             remote_spells = response.json()
             spell_manifest = {spell['name']: spell for spell in remote_spells.get("spells", [])}
@@ -314,7 +413,7 @@ class SpellRegistry:
 
             # List local spells
             click.echo("\n=== Spells Within Your Orb ===")
-            spell_files = glob.glob(os.path.join(self.orb_dir, "*.spell"))
+            spell_files = self._orb_spells()
             if spell_files:
                 for spell_path in spell_files:
                     spell_name = os.path.splitext(os.path.basename(spell_path))[0]
@@ -333,7 +432,7 @@ class SpellRegistry:
         except requests.RequestException as e:
             click.echo(f"\nThe chamber is shrouded in mist... ({e})")
             # Still show local spells if remote fails
-            spell_files = glob.glob(os.path.join(self.orb_dir, "*.spell"))
+            spell_files = self._orb_spells()
             if spell_files:
                 for spell_path in spell_files:
                     spell_name = os.path.splitext(os.path.basename(spell_path))[0]
@@ -383,7 +482,7 @@ def ponder(args, archive):
                              click.style(description, fg="bright_white"))
 
         # Display orb spells (just names)
-        orb_spells = glob.glob(os.path.join(registry.orb_dir, "*.spell"))
+        orb_spells = registry._orb_spells()
         if orb_spells:
             click.echo(click.style("\n=== Spells Within Your Orb ===", fg="bright_blue", bold=True))
             for orb_spell_path in orb_spells:
@@ -391,11 +490,11 @@ def ponder(args, archive):
                 click.echo(click.style(f"{spell_name}", fg="magenta"))
 
         # Check for spells in orb that are not installed
+        installed_spells = registry._installed_spells()
         missing_spells = []
         for orb_spell_path in orb_spells:
             spell_name = os.path.splitext(os.path.basename(orb_spell_path))[0]
-            spell_path = os.path.join(registry.spells_dir, f"{spell_name}.py")
-            if not os.path.exists(spell_path):
+            if spell_name not in installed_spells:
                 missing_spells.append(spell_name)
 
         if missing_spells:
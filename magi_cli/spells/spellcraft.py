@@ -257,7 +257,8 @@ class SpellRecipe:
                 entry_point=yaml_config['entry_point'],  # Use the updated entry point
                 description=config['description'],
                 spell_dir=self.spell_dir,
-                verify_structure=False  # Skip structure verification since we copied exactly
+                verify_structure=False,  # Skip structure verification since we copied exactly
+                persist_yaml=False  # The spell directory is a temporary copy
             )
         
         # If no spell.yaml exists, fallback to manual bundling
@@ -332,7 +333,7 @@ class SpellRecipe:
         
         # Create spell bundle
         spell_bundle = SpellBundle(spell_dir)
-        bundle_path = spell_bundle.create_bundle(self.tome_dir)
+        bundle_path = spell_bundle.create_bundle(self.tome_dir, persist_yaml=False)
         
         return bundle_path
 
@@ -358,7 +359,7 @@ class SpellRecipe:
         """Bundle the spell directory into a .spell file."""
         bundle = SpellBundle(self.spell_dir)
         try:
-            return bundle.create_bundle(self.tome_dir)
+            return bundle.create_bundle(self.tome_dir, persist_yaml=False)
         finally:
             shutil.rmtree(self.temp_dir)
 